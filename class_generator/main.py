@@ -1,26 +1,48 @@
 """This is an exemple for using librairie."""
 
-import configparser as cfp
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
-from pydash import get  # type: ignore
+from src.fast_config_parser import FastConfigParser  # type: ignore
 from src.gen_class import GenClass # type: ignore
-from src.utils import Utils  # type: ignore
 
 
-if __name__ == "__main__":
+def _build_one(file_config: str) -> None:
+    """Read a config file and generate its class and tests files.
+
+    Args:
+        file_config (str): The path of config file.
+    """
+    config = FastConfigParser().read(file_config)
+    GenClass(
+      config["class_config"]["name_file"],
+      config["attributes"],
+      config["methods"]
+    )
 
-    Utils.gen_pickle_files()
 
+if __name__ == "__main__":
+
+    files_config: list = []
     try:
-        for file_config in os.listdir("./config"):
-            config = cfp.ConfigParser()
-            config.read(f"./config/{file_config}")
-            GenClass(
-              get(config, "class_config.name_file"),
-              get(config, "attributes"),
-              get(config, "methods")
-            )
-    except Exception as err:
+        with os.scandir("./config") as entries:
+            files_config = [
+                entry.path
+                for entry in entries
+                if entry.is_file(follow_symlinks=False)
+                and not entry.name.startswith(".")
+            ]
+    except OSError as err:
         print(f"ERROR: {err}")
+
+    with ProcessPoolExecutor() as executor:
+        futures = {
+            executor.submit(_build_one, file_config): file_config
+            for file_config in files_config
+        }
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except (OSError, KeyError, ValueError) as err:
+                print(f"ERROR: {futures[future]}: {err!r}")
     input("Press Enter for quit...")
@@ -0,0 +1,79 @@
+"""This module contains FastConfigParser for read config files."""
+
+import re
+from typing import Optional
+
+
+class FastConfigParser:
+    """FastConfigParser is a light parser for simple config files.
+
+    Only [section] headers, key = value (or key: value) lines, indented
+    continuation lines and full line comments are supported, which is
+    all that the class generator config files use.
+    """
+
+    _SECTION = re.compile(r"^\[(.+?)\][ \t]*$")
+    _KV = re.compile(r"^([^=:\s#;][^=:\r\n]*?)[ \t]*[=:][ \t]*(.*)$")
+
+    def read(self, path_file: str) -> dict:
+        """Read and parse a config file.
+
+        Args:
+            path_file (str): The path of config file.
+
+        Returns:
+            dict: The config with format {section: {key: value}}.
+        """
+        with open(path_file, encoding="utf-8") as file:
+            return self.parse(file.read())
+
+    def parse(self, content: str) -> dict:
+        """Parse the content of a config file.
+
+        Indented lines continue the value of the previous key, they are
+        joined with a newline like configparser does.
+
+        Args:
+            content (str): The content of config file.
+
+        Raises:
+            ValueError: If a line is neither a section, a key = value,
+                a continuation, a comment nor blank, or if a section or
+                a key is repeated.
+
+        Returns:
+            dict: The config with format {section: {key: value}}.
+        """
+        config: dict = {}
+        section: Optional[dict] = None
+        key: str = ""
+        blank_lines: int = 0
+        for number, line in enumerate(content.splitlines(), 1):
+            stripped: str = line.strip()
+            if not stripped:
+                blank_lines += 1
+                continue
+            if stripped[0] in "#;":
+                continue
+            if line[0] in " \t" and section is not None and key:
+                section[key] += "\n" * (blank_lines + 1) + stripped
+                blank_lines = 0
+                continue
+            blank_lines = 0
+            match = self._SECTION.match(line)
+            if match is not None:
+                if match[1] in config:
+                    raise ValueError(
+                        f"Line {number} repeats section: {match[1]!r}"
+                    )
+                section = config[match[1]] = {}
+                key = ""
+                continue
+            match = self._KV.match(line)
+            if match is None or section is None:
+                raise ValueError(f"Line {number} is not valid: {line!r}")
+            key = match[1].lower()
+            if key in section:
+                raise ValueError(f"Line {number} repeats key: {key!r}")
+            section[key] = match[2].strip()
+        return config
@@ -1,14 +1,24 @@
 """This module contains GenClass for generate class files."""
 
-import pickle
 import os
-from typing import Any
+import re
+import sys
+from functools import lru_cache
 
-from pydash import get  # type: ignore
+from .templates import _templates as templates
 
 
-PATH_TEMPLATES = "src/templates"
 PATH_GEN_FILES = "./gen_files"
+PATH_TESTS = f"{PATH_GEN_FILES}/tests_unittest"
+PATH_ASSETS = f"{PATH_TESTS}/assets"
+WRITE_BUFFER_SIZE = 256 * 1024
+_TAB1 = " " * 4
+_TAB2 = " " * 8
+_TAB3 = " " * 12
+_TESTS_HEADER, _TESTS_FOOTER = templates.TESTS.split("{methods_for_tests}")
+_PARAM_RE = re.compile(
+    r"\s*([^:=]*?[^:=\s])\s*(?::\s*([^=]*?))?\s*(?:=\s*(.*?))?\s*$"
+)
 
 
 class GenClass:
@@ -41,49 +51,24 @@ class GenClass:
             inherit (str, optional): The class from which the generated
                 class inherits, by default = "".
             name_class (str): The name of class calculated with name_file.
+            methods_parsed (dict): The dictionary of methods with format
+                {methods_name: list_of_parsed_params}
         """
-        self._name_file: str = name_file
+        self._name_file: str = sys.intern(name_file)
         self._attributes: dict = attributes
         self._methods: dict = methods
         self._inherit: str = f"({inherit}):" if inherit else ":"
-        self._name_class: str = "".join(
+        self._name_class: str = sys.intern("".join(
             part_name.capitalize() for part_name in self._name_file.split("_")
-        )
+        ))
+        self._methods_parsed: dict = {
+            method_name: self._parse_method_params(method_params)
+            for method_name, method_params in self._methods.items()
+        }
 
         self._gen_class()
         self._gen_unit_tests()
 
-    def _gen_attributes(self) -> Any:
-        """Get attribute name and type from python generator.
-
-        Return:
-            Any: The name of attribute and the type of attribute.
-        """
-        for attribute_name, attribute_type in self._attributes.items():
-            yield attribute_name, attribute_type
-
-    def _gen_methods(self) -> Any:
-        """Get method name and params from python generator.
-
-        Return:
-            Any: The name of method and params.
-        """
-        for method_name, method_params in self._methods.items():
-            yield method_name, method_params
-
-    def _set_tab(self, nb_tab: int = 1, spaces_by_tab: int = 4) -> str:
-        """Build tabulations with spaces, 4 spaces by tab by default.
-
-        Args:
-            nb_tab (int, optional): The number of tabulations, 1 by default.
-            spaces_by_tab (int, optional): The number of spaces
-                to define tabulation, 4 by default.
-
-        Returns:
-            str: The string contains the number of spaces to define.
-        """
-        return " " * spaces_by_tab * nb_tab
-
     def _get_accessors(
         self,
         attribute_name: str,
@@ -98,16 +83,24 @@ class GenClass:
         Returns:
             str: Accessors from the attribute.
         """
-        result: str = ""
-        with open(f"{PATH_TEMPLATES}/accessors", "rb") as file:
-            result = pickle.load(file).replace(
-                "{attribute_name}",
-                attribute_name
-            ).replace(
-                "{attribute_type}",
-                attribute_type
-            )
-        return result
+        return self._accessors_for(attribute_name, attribute_type)
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _accessors_for(attribute_name: str, attribute_type: str) -> str:
+        """Render accessors, memoized by attribute name and type.
+
+        Args:
+            attribute_name (str): The name of attribute.
+            attribute_type (str): The type of attribute.
+
+        Returns:
+            str: Accessors from the attribute.
+        """
+        return templates.ACCESSORS.format_map({
+            "attribute_name": attribute_name,
+            "attribute_type": attribute_type
+        })
 
     def _get_attributes_strings(self) -> tuple:
         """Get attributes strings for params, init and docstrings.
@@ -115,20 +108,25 @@ class GenClass:
         Returns:
             tuple: The strings for params, init and docstrings.
         """
-        desc_attr: str = "Explain this attr..."
-        attributes_docstring: str = "\n".join(
-            f"{self._set_tab(3)}{attr_name} ({attr_type}): {desc_attr}"
-            for attr_name, attr_type in self._gen_attributes()
-        )
-        attributes_params: str = "".join(
-            f",\n{self._set_tab(2)}{attr_name}: {attr_type}"
-            for attr_name, attr_type in self._gen_attributes()
-        )
-        attributes_init: str = "\n".join(
-            f"{self._set_tab(2)}self._{attr_name}: {attr_type} = {attr_name}"
-            for attr_name, attr_type in self._gen_attributes()
+        if not self._attributes:
+            return "", "", ""
+        suffix_docstring: str = "): Explain this attr..."
+        attributes_docstring: list = []
+        attributes_params: list = []
+        attributes_init: list = []
+        for attr_name, attr_type in self._attributes.items():
+            attributes_docstring.append(
+                _TAB3 + attr_name + " (" + attr_type + suffix_docstring
+            )
+            attributes_params.append(f",\n{_TAB2}{attr_name}: {attr_type}")
+            attributes_init.append(
+                f"{_TAB2}self._{attr_name}: {attr_type} = {attr_name}"
+            )
+        return (
+            "\n".join(attributes_docstring),
+            "".join(attributes_params),
+            "\n".join(attributes_init)
         )
-        return attributes_docstring, attributes_params, attributes_init
 
     def _get_class(self) -> str:
         """Get structure of class.
@@ -136,33 +134,23 @@ class GenClass:
         Returns:
             str: The structure of class with necessary replaces.
         """
-        result: str = ""
         (
             attributes_docstring,
             attributes_params,
             attributes_init
         ) = self._get_attributes_strings()
-        with open(f"{PATH_TEMPLATES}/class", "rb") as file:
-            result = pickle.load(file).replace(
-                "{class_name}",
-                self._name_class
-            ).replace(
-                "{attributes_params}",
-                attributes_params
-            ).replace(
-                "{attributes_docstring}",
-                attributes_docstring
-            ).replace(
-                "{attributes_init}",
-                attributes_init
-            )
-        return result
+        return templates.CLASS.format_map({
+            "class_name": self._name_class,
+            "attributes_params": attributes_params,
+            "attributes_docstring": attributes_docstring,
+            "attributes_init": attributes_init
+        })
 
     def _get_methods_strings(self, method_params: list) -> tuple:
         """Get methods strings for params, returns and docstrings.
 
         Args:
-            method_params (list): The list of parameters for method.
+            method_params (list): The parsed parameters for method.
 
         Returns:
             tuple: The strings for params, returns and docstrings.
@@ -171,20 +159,19 @@ class GenClass:
         msg_desc: str = "Explain this..."
         params: dict = self._get_methods_dictionary(method_params)
 
-        return_type: str = get(params, "return.0", "None")
+        return_type: str = params.get("return", ("None",))[0]
         if return_type != "None":
-            returns_string = f"\n\n{self._set_tab(2)}Returns:\n"
-            returns_string += f"{self._set_tab(3)}{return_type}: {msg_desc}"
+            returns_string = f"\n\n{_TAB2}Returns:\n"
+            returns_string += f"{_TAB3}{return_type}: {msg_desc}"
 
-        params_docstring: str = f"\n{self._set_tab(3)}".join(
+        params_docstring: str = f"\n{_TAB3}".join(
             f"{k} ({v[0]}): {msg_desc}"
             for k, v in params.items()
             if k != "return"
         )
 
-        method_params_list: str = f",\n{self._set_tab(2)}".join(
-            param_name.strip()
-            for param_name in method_params[:-1]
+        method_params_list: str = f",\n{_TAB2}".join(
+            param for param, *_ in method_params[:-1]
         )
 
         return (
@@ -194,32 +181,43 @@ class GenClass:
             returns_string
         )
 
+    def _parse_method_params(self, method_params: str) -> list:
+        """Parse method's parameters once.
+
+        Args:
+            method_params (str): The parameters of method.
+
+        Raises:
+            ValueError: If a non blank parameter can not be parsed.
+
+        Returns:
+            list: The parsed parameters with format
+                (param, param_name, param_type, param_default_value).
+        """
+        params = []
+        for param in method_params.split(","):
+            if not param.strip():
+                continue
+            match = _PARAM_RE.match(param)
+            if match is None:
+                raise ValueError(f"Parameter is not valid: {param!r}")
+            params.append((param.strip(), match[1], match[2] or "", match[3]))
+        return params
+
     def _get_methods_dictionary(self, method_params: list) -> dict:
         """Get dictionary of method's parameters.
 
         Args:
-            method_params (list): The list of parameters for method.
+            method_params (list): The parsed parameters for method.
 
         Returns:
             dict: The dictionary of method's parameters.
         """
-        params = {}
-        for param in method_params:
-            param_split_name_type = param.split(":")
-            param_split_type_default_value = get(
-                param_split_name_type, 1
-            ).split("=")
-            param_name = get(param_split_name_type, 0).strip()
-            param_type = get(param_split_type_default_value, 0).strip()
-            param_default_value = get(
-                param_split_type_default_value,
-                1
-            )
-            param_default_value = param_default_value.strip() \
-                if param_default_value \
-                else param_default_value
-            params[param_name] = (param_type, param_default_value)
-        return params
+        return {
+            param_name: (param_type, param_default_value)
+            for _, param_name, param_type, param_default_value
+            in method_params
+        }
 
     def _get_method(
         self,
@@ -230,146 +228,116 @@ class GenClass:
 
         Args:
             method_name (str): The name of method.
-            method_params (list): The list of parameters for method.
+            method_params (list): The parsed parameters for method.
 
         Returns:
             str: The signature of method.
         """
-        result: str = ""
         (
             method_params_list,
             return_type,
             params_docstring,
             returns_string
         ) = self._get_methods_strings(method_params)
-        with open(f"{PATH_TEMPLATES}/methods", "rb") as file:
-            result = pickle.load(file).replace(
-                "{method_name}",
-                method_name
-            ).replace(
-                "{method_params}",
-                method_params_list
-            ).replace(
-                "{return_type}",
-                return_type
-            ).replace(
-                "{params_docstring}",
-                params_docstring
-            ).replace(
-                "{returns_string}",
-                returns_string
-            )
-        return result
+        return templates.METHODS.format_map({
+            "method_name": method_name,
+            "method_params": method_params_list,
+            "return_type": return_type,
+            "params_docstring": params_docstring,
+            "returns_string": returns_string
+        })
 
     def _gen_class(self) -> None:
         """Generate class files with config files."""
         self._create_folder_and_init_file(PATH_GEN_FILES)
-        with open(f"{PATH_GEN_FILES}/{self._name_file}.py", "w") as file:
-            file.write(self._get_class())
-
-            for accesseur in (
+        parts: list = [self._get_class()]
+        if self._attributes:
+            parts.extend(
                 self._get_accessors(attr_name, attr_type)
-                for attr_name, attr_type in self._gen_attributes()
-            ):
-                file.write(accesseur)
-
-            for method in (
-                self._get_method(method_name, method_params.split(","))
-                for method_name, method_params in self._gen_methods()
-            ):
-                file.write(method)
+                for attr_name, attr_type in self._attributes.items()
+            )
+        if self._methods_parsed:
+            parts.extend(
+                self._get_method(method_name, method_params)
+                for method_name, method_params in self._methods_parsed.items()
+            )
+        with open(
+            f"{PATH_GEN_FILES}/{self._name_file}.py",
+            "w",
+            buffering=WRITE_BUFFER_SIZE
+        ) as file:
+            file.write("".join(parts))
 
     def _create_folder_and_init_file(self, path_folder: str) -> None:
-        """Create folder and __init__.py file.
+        """Create folder and __init__.py file if they do not exist.
 
         Args:
             path_folder (str): The path to create folder and file.
         """
         os.makedirs(path_folder, exist_ok=True)
-        with open(
-            f"{path_folder}/__init__.py",
-            "w"
-        ) as file:
-            file.write("")
+        path_init: str = f"{path_folder}/__init__.py"
+        if not os.path.exists(path_init):
+            with open(path_init, "w"):
+                pass
 
     def _get_method_tests(
         self,
         method_name: str,
-        method_params: str
+        method_params: list
     ) -> str:
         """Get the string for methods in class of tests.
 
         Args:
             method_name (str): The name of method.
-            method_params (str): The parameters of method.
+            method_params (list): The parsed parameters of method.
 
         Returns:
             str: The method of test.
         """
-        result: str = ""
-        params: str = f",\n{self._set_tab(2)}#{self._set_tab()}".join(
-            get(param.split(":"), 0)
-            for param in method_params.split(",")[:-1]
+        params: str = f",\n{_TAB2}#{_TAB1} ".join(
+            param_name for _, param_name, *_ in method_params[:-1]
         )
-        with open(
-            f"{PATH_TEMPLATES}/methods_tests",
-            "rb"
-        ) as pickle_file_methods:
-            result = pickle.load(
-                pickle_file_methods
-            ).replace(
-                "{method_name}",
-                method_name
-            ).replace(
-                "{class_file}",
-                self._name_file
-            ).replace(
-                "{class_name}",
-                self._name_class
-            ).replace(
-                "{params}",
-                params
-            )
-        return result
+        return templates.METHODS_TESTS.format_map({
+            "method_name": method_name,
+            "class_file": self._name_file,
+            "class_name": self._name_class,
+            "params": params
+        })
 
-    def _get_class_tests(self, methods_for_tests: str) -> str:
-        """Get the class of tests.
+    def _get_class_tests_header(self) -> str:
+        """Get the class of tests until its methods.
 
-        Args:
-            methods_for_tests (str): Methods for class tests.
+        Returns:
+            The header of class of tests.
+        """
+        return _TESTS_HEADER.format_map({
+            "class_name": self._name_class,
+            "file_name": self._name_file
+        })
+
+    def _get_class_tests_footer(self) -> str:
+        """Get the class of tests after its methods.
 
         Returns:
-            The class of tests.
+            The footer of class of tests.
         """
-        result: str = ""
-        with open(f"{PATH_TEMPLATES}/tests", "rb") as pickle_file:
-            result = pickle.load(pickle_file).replace(
-                "{class_name}",
-                self._name_class
-            ).replace(
-                "{methods_for_tests}",
-                methods_for_tests
-            ).replace(
-                "{file_name}",
-                self._name_file
-            )
-        return result
+        return _TESTS_FOOTER.format_map({
+            "class_name": self._name_class,
+            "file_name": self._name_file
+        })
 
     def _gen_unit_tests(self) -> None:
         """Generate the units tests for class."""
-        path_tests: str = f"{PATH_GEN_FILES}/tests_unittest"
-        path_assets: str = f"{path_tests}/assets"
-        path_file_class_tests: str = f"{path_tests}/test_{self._name_file}.py"
-        self._create_folder_and_init_file(path_tests)
-        self._create_folder_and_init_file(path_assets)
-
-        with open(path_file_class_tests, "w") as file:
-            result_methods: str = "".join(
-                self._get_method_tests(method_name, method_params)
-                for method_name, method_params in self._methods.items()
-            )
-            file.write(
-                self._get_class_tests(
-                    result_methods
-                )
-            )
+        path_file_class_tests: str = f"{PATH_TESTS}/test_{self._name_file}.py"
+        self._create_folder_and_init_file(PATH_TESTS)
+        self._create_folder_and_init_file(PATH_ASSETS)
+
+        with open(
+            path_file_class_tests,
+            "w",
+            buffering=WRITE_BUFFER_SIZE
+        ) as file:
+            file.write(self._get_class_tests_header())
+            for method_name, method_params in self._methods_parsed.items():
+                file.write(self._get_method_tests(method_name, method_params))
+            file.write(self._get_class_tests_footer())
@@ -0,0 +1,89 @@
+"""This module contains the templates used by GenClass.
+
+Generated by Utils.gen_templates_module from src/templates/src/*.txt,
+edit the .txt files and regenerate instead of editing this module.
+Templates are str.format strings, literal braces must be doubled.
+"""
+
+ACCESSORS = '''
+    @property
+    def {attribute_name}(self) -> {attribute_type}:
+        """Get attribute {attribute_name}.
+
+        Returns:
+            {attribute_type}: The attribute {attribute_name}.
+        """
+        return self._{attribute_name}
+
+    @{attribute_name}.setter
+    def {attribute_name}(self, {attribute_name}) -> None:
+        """Set attribute {attribute_name}.
+
+        Args:
+            {attribute_name} ({attribute_type}): The new value for {attribute_name}.
+        """
+        self._{attribute_name} = {attribute_name}
+'''
+
+CLASS = '''"""This module contains the definition of class {class_name}."""
+
+from typing import Any
+
+
+class {class_name}:
+    """Here docstring for class: To explain..."""
+
+    def __init__(
+        self{attributes_params}
+    ) -> None:
+        """Initialize the class.
+
+        Args:
+{attributes_docstring}
+
+        Attributes:
+{attributes_docstring}
+        """
+{attributes_init}
+'''
+
+METHODS = '''
+    def {method_name}(
+        self,
+        {method_params}
+    ) -> {return_type}:
+        """Explain this method...
+
+        Args:
+            {params_docstring}{returns_string}
+        """
+        # TODO Dev this method...
+'''
+
+METHODS_TESTS = '''
+    def test_{method_name}(self) -> None:
+        """Test the method {method_name}."""
+        {class_file} = {class_name}()
+
+        # TODO Calculate the expected...
+        # result_to_expected: ... = ...
+        # result_{class_file}: ... = {class_file}.{method_name}(
+        #     {params}
+        # )
+        # self.assertEqual(
+        #     result_to_expected,
+        #     result_{class_file}
+        # )
+'''
+
+TESTS = '''"""This module contains the tests for class {class_name}."""
+
+import unittest
+from typing import Any
+
+from class_generator.gen_files.{file_name} import {class_name}
+
+
+class Test{class_name}(unittest.TestCase):
+    """This class for testing the class {class_name}."""
+{methods_for_tests}'''
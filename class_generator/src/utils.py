@@ -0,0 +1,55 @@
+"""This module contains Utils for maintain the class generator."""
+
+import os
+
+
+PATH_TEMPLATES = "src/templates"
+PATH_TEMPLATES_SOURCES = f"{PATH_TEMPLATES}/src"
+PATH_TEMPLATES_MODULE = f"{PATH_TEMPLATES}/_templates.py"
+TEMPLATES_MODULE_DOCSTRING = (
+    '"""This module contains the templates used by GenClass.\n'
+    "\n"
+    "Generated by Utils.gen_templates_module from src/templates/src/*.txt,\n"
+    "edit the .txt files and regenerate instead of editing this module.\n"
+    "Templates are str.format strings, literal braces must be doubled.\n"
+    '"""\n'
+)
+
+
+class Utils:
+    """Utils is class for maintenance tasks of the class generator."""
+
+    @staticmethod
+    def gen_templates_module() -> None:
+        """Generate the templates module from the .txt templates.
+
+        Each file src/templates/src/<name>.txt becomes the constant
+        <NAME> in src/templates/_templates.py.
+
+        Raises:
+            ValueError: If a template can not be written as a triple
+                quoted string constant.
+        """
+        parts: list = [TEMPLATES_MODULE_DOCSTRING]
+        for name_file in sorted(os.listdir(PATH_TEMPLATES_SOURCES)):
+            name, extension = os.path.splitext(name_file)
+            if extension != ".txt":
+                continue
+            with open(f"{PATH_TEMPLATES_SOURCES}/{name_file}") as file:
+                template: str = file.read()
+            if (
+                "'''" in template
+                or "\\" in template
+                or template.endswith("'")
+            ):
+                raise ValueError(
+                    f"Template {name_file} contains ''', a backslash"
+                    " or ends with '."
+                )
+            parts.append(f"\n{name.upper()} = '''{template}'''\n")
+        with open(PATH_TEMPLATES_MODULE, "w", newline="\r\n") as file:
+            file.write("".join(parts))
+
+
+if __name__ == "__main__":
+    Utils.gen_templates_module()